@@ -1,15 +1,11 @@
 #!/usr/bin/env python3
 
 import enum
+import functools
+import multiprocessing
 import os
-import regex
 import sys
 import typing
-import xml.sax.saxutils
-
-# Set boilerplate mandated by the regex package.
-# See https://pypi.python.org/pypi/regex/
-regex.DEFAULT_VERSION = regex.VERSION1
 
 """
 A file that converts shorthand, that for the sake
@@ -247,6 +243,29 @@ the last entry in a file.
 """
 
 
+# Maps the shorthand noreturn arguments to their XML values.
+_NORETURN_VALUES = {
+    "t": "true",
+    "f": "false",
+}
+
+# Opening tags for allocation functions that do and don't initialize their data.
+_ALLOC_INIT_TRUE = "<alloc init=\"true\">"
+_ALLOC_INIT_FALSE = "<alloc init=\"false\">"
+
+# Translation table for escaping characters that are reserved in XML
+# attribute values. Unlike repeated replace() calls, translate() makes
+# a single pass over the string.
+_XML_ESCAPE_TABLE = str.maketrans({
+    "&":  "&amp;",
+    "<":  "&lt;",
+    ">":  "&gt;",
+    "'":  "&apos;",
+    "\"": "&quot;",
+})
+_XML_SPECIAL_CHARS = frozenset("&<>'\"")
+
+
 class ParseError(Exception):
     """
     Exception class used to signify an error
@@ -255,6 +274,30 @@ class ParseError(Exception):
     pass
 
 
+class PrefixTable:
+    """
+    Maps case-insensitive starting sequences to values.
+
+    Lookups lowercase the start of the text once and then probe
+    the table with each key length, longest first, so classifying
+    a line costs a handful of dict lookups regardless of how many
+    entries the table has.
+    """
+
+    def __init__(self, entries: typing.Dict[str, typing.Any]):
+        self.entries = entries
+        self.lengths = sorted({len(key) for key in entries}, reverse=True)
+
+    def lookup(self, text: str, default: typing.Any = None) -> typing.Any:
+        head = text[:self.lengths[0]].lower()
+        for length in self.lengths:
+            value = self.entries.get(head[:length])
+            if value is not None:
+                return value
+
+        return default
+
+
 # These entries are kind of poorly named.
 # They refer to 'level' indentation as in:
 #
@@ -275,6 +318,20 @@ class Indentation(str, enum.Enum):
     FUNCTION_ENTRY = "        "
 
 
+# Plain string forms of the indentation levels for use when composing output.
+# Using the enum members directly pays for a member lookup on every use, and
+# formatting them with format() yields the member name on newer Pythons.
+_IND_F = Indentation.FUNCTION.value
+_IND_FE = Indentation.FUNCTION_ENTRY.value
+
+# Function entries that never vary, pre-joined with their indentation.
+_FE_PURE = _IND_FE + "<pure/>\n"
+_FE_CONST = _IND_FE + "<const/>\n"
+_FE_LEAK_IGNORE = _IND_FE + "<leak-ignore/>\n"
+_FE_USE_RETVAL = _IND_FE + "<use-retval/>\n"
+_FUNCTION_END = _IND_F + "</function>\n"
+
+
 @enum.unique
 class LineType(enum.Enum):
     """Describes the possible types of lines to parse input as"""
@@ -301,6 +358,17 @@ class LineType(enum.Enum):
     CONTAINER       = 8
 
 
+# Starting sequences for each kind of top-level line.
+_LINE_TYPE_PREFIXES = PrefixTable({
+    "fn":  LineType.FUNCTION,
+    "mem": LineType.MEM_ALLOC,
+    "res": LineType.RES_ALLOC,
+    "pod": LineType.PODTYPE,
+    "def": LineType.DEFINE,
+    "con": LineType.CONTAINER,
+})
+
+
 def determine_line_type(line: str) -> LineType:
     """
     Determines the line type based off the
@@ -308,24 +376,14 @@ def determine_line_type(line: str) -> LineType:
     """
     if len(line) == 0:
         return LineType.EMPTY
-    if line.startswith("#"):
+
+    first_char = line[0]
+    if first_char == "#":
         return LineType.COMMENT_INCLUDE
-    if line.startswith(";"):
+    if first_char == ";":
         return LineType.COMMENT_EXCLUDE
-    if regex.match("^fn", line, regex.IGNORECASE):
-        return LineType.FUNCTION
-    if regex.match("^mem", line, regex.IGNORECASE):
-        return LineType.MEM_ALLOC
-    if regex.match("^res", line, regex.IGNORECASE):
-        return LineType.RES_ALLOC
-    if regex.match("^pod", line, regex.IGNORECASE):
-        return LineType.PODTYPE
-    if regex.match("^def", line, regex.IGNORECASE):
-        return LineType.DEFINE
-    if regex.match("^con", line, regex.IGNORECASE):
-        return LineType.CONTAINER
-
-    return LineType.ERROR
+
+    return _LINE_TYPE_PREFIXES.lookup(line, LineType.ERROR)
 
 
 @enum.unique
@@ -340,17 +398,28 @@ class AllocationLineType(enum.Enum):
     DEALLOC_FUNC = 2
 
 
-def determine_allocation_line_type(line: str) -> AllocationLineType:
+# Starting sequences for each kind of allocation block entry.
+_ALLOCATION_LINE_TYPE_PREFIXES = PrefixTable({
+    "alloc":   AllocationLineType.ALLOC_FUNC,
+    "dealloc": AllocationLineType.DEALLOC_FUNC,
+})
+
+
+def classify_allocation_line(line: str) -> typing.Tuple[AllocationLineType, typing.List[str]]:
     """
     Determines the type of a line within an allocation
     block based off the starting characters on the line.
+
+    The line's tokens are returned alongside its type so
+    that callers don't need to split the line again.
     """
     if len(line) == 0:
-        return AllocationLineType.EMPTY
-    if regex.match("^alloc", line, regex.IGNORECASE):
-        return AllocationLineType.ALLOC_FUNC
-    if regex.match("^dealloc", line, regex.IGNORECASE):
-        return AllocationLineType.DEALLOC_FUNC
+        return AllocationLineType.EMPTY, []
+
+    tokens = line.split()
+    line_type = _ALLOCATION_LINE_TYPE_PREFIXES.lookup(tokens[0])
+    if line_type is not None:
+        return line_type, tokens
 
     raise ParseError("Invalid allocation entry line '{}' encountered.".format(line))
 
@@ -377,6 +446,22 @@ class FunctionLineType(enum.Enum):
     ARGUMENT    = 7
 
 
+# Starting sequences for each kind of function entry.
+# Arguments are identified by a leading digit instead.
+_FUNCTION_LINE_TYPE_PREFIXES = PrefixTable({
+    "pure":  FunctionLineType.PURE,
+    "const": FunctionLineType.CONST,
+    "ur":    FunctionLineType.USE_RETVAL,
+    "rv":    FunctionLineType.RETURN_TYPE,
+    "li":    FunctionLineType.LEAK_IGNORE,
+    "nr":    FunctionLineType.NORETURN,
+})
+
+
+# Function entries like 'li' or 'ur' repeat constantly across a file,
+# so classifications are cached. Invalid lines raise rather than return,
+# and exceptions are never cached, so errors always report the offending line.
+@functools.lru_cache(maxsize=256)
 def determine_function_line_type(line: str) -> FunctionLineType:
     """
     Determines the type of line within a function based off
@@ -384,70 +469,27 @@ def determine_function_line_type(line: str) -> FunctionLineType:
     """
     if len(line) == 0:
         return FunctionLineType.EMPTY
-    if regex.match("^pure", line, regex.IGNORECASE):
-        return FunctionLineType.PURE
-    if regex.match("^const", line, regex.IGNORECASE):
-        return FunctionLineType.CONST
-    if regex.match("^ur", line, regex.IGNORECASE):
-        return FunctionLineType.USE_RETVAL
-    if regex.match("^rv", line, regex.IGNORECASE):
-        return FunctionLineType.RETURN_TYPE
-    if regex.match("^li", line, regex.IGNORECASE):
-        return FunctionLineType.LEAK_IGNORE
-    if regex.match("^nr", line, regex.IGNORECASE):
-        return FunctionLineType.NORETURN
-    if regex.match("^[0-9]+", line, regex.IGNORECASE):
+
+    line_type = _FUNCTION_LINE_TYPE_PREFIXES.lookup(line)
+    if line_type is not None:
+        return line_type
+    if "0" <= line[0] <= "9":
         return FunctionLineType.ARGUMENT
 
     raise ParseError("Invalid function line type '{}' encountered.".format(line))
 
 
-@enum.unique
-class ArgumentAttributeType(enum.Enum):
-    """The types of attributes that may be used with argument specifiers."""
-
-    """Format string tag (<formatstr type="printf|scanf"/> defaults to printf if type is omitted)"""
-    FORMAT_STR       = 0
-    """Minimum size tag (<minsize type="" arg=""/>)"""
-    MIN_SIZE         = 1
-    """Not bool tag (<not-bool/>)"""
-    NOT_BOOL         = 2
-    """Not null tag (<not-null/>)"""
-    NOT_NULL         = 3
-    """Not uninitialized tag (<not-uninit/>)"""
-    NOT_UNINIT       = 4
-    """Null-terminated string tag (<strz/>)"""
-    NULL_TERM_STRING = 5
-    """Valid range tag (<valid></valid>)"""
-    VALID_RANGE      = 6
-
-
-def determine_argument_attribute_type(attribute: str) -> ArgumentAttributeType:
-    """
-    Determines an argument attribute type based on the initial
-    part of its name.
-    """
-    if regex.match("^fmt", attribute, regex.IGNORECASE):
-        return ArgumentAttributeType.FORMAT_STR
-    if regex.match("^min", attribute, regex.IGNORECASE):
-        return ArgumentAttributeType.MIN_SIZE
-    if regex.match("^nb", attribute, regex.IGNORECASE):
-        return ArgumentAttributeType.NOT_BOOL
-    if regex.match("^nn", attribute, regex.IGNORECASE):
-        return ArgumentAttributeType.NOT_NULL
-    if regex.match("^nu", attribute, regex.IGNORECASE):
-        return ArgumentAttributeType.NOT_UNINIT
-    if regex.match("^s", attribute, regex.IGNORECASE):
-        return ArgumentAttributeType.NULL_TERM_STRING
-    if regex.match("^v", attribute, regex.IGNORECASE):
-        return ArgumentAttributeType.VALID_RANGE
-
-    raise ParseError("Invalid argument attribute '{}' encountered.".format(attribute))
+# Retrieves the text between {}, or None if there isn't a braced section.
+def retrieve_match_between_braces(line: str) -> typing.Optional[str]:
+    begin = line.find("{")
+    if begin < 0:
+        return None
 
+    end = line.find("}", begin + 1)
+    if end < 0:
+        return None
 
-# Retrieves the text between {}
-def retrieve_match_between_braces(line: str):
-    return regex.search("(?<={)[^}]*(?=})", line)
+    return line[begin + 1:end]
 
 
 class Parser:
@@ -458,6 +500,7 @@ class Parser:
     so I apologize in advance if this looks awful.
     """
 
+    # Expects lines to already have surrounding whitespace stripped.
     def __init__(self, lines: typing.List[str], out_file: typing.IO[str]):
         self.lines = lines
         self.out_file = out_file
@@ -474,15 +517,15 @@ class Parser:
 
     # Creates a <returnValue> tag for a function
     def compose_return_value_string(self, line: str) -> str:
-        tokens = line.split(" ", maxsplit=1)
+        tokens = line.split(maxsplit=1)
         if len(tokens) < 2:
             raise ParseError("Malformed function return value tag '{}'. Missing return type.".format(line))
 
-        return "<returnValue type=\"{}\"/>\n".format(tokens[1])
+        return f"<returnValue type=\"{tokens[1]}\"/>\n"
 
     # Creates a <noreturn> tag for a function
     def compose_noreturn_string(self, line: str) -> str:
-        tokens = line.split(" ")
+        tokens = line.split()
         if len(tokens) < 2:
             raise ParseError("Malformed noreturn tag '{}'. Missing 't' or 'f'.".format(line))
         if len(tokens) > 2:
@@ -490,40 +533,36 @@ class Parser:
             raise ParseError("Excess arguments in noreturn tag. Expected '{}' but saw '{}'."
                              .format(expected_str, line))
 
-        operand = tokens[1].lower()
-        if operand == "t":
-            operand = "true"
-        elif operand == "f":
-            operand = "false"
-        else:
+        operand = _NORETURN_VALUES.get(tokens[1].lower())
+        if operand is None:
             raise ParseError("Malformed noreturn tag '{}'. Argument is not 't' or 'f'.".format(line))
 
-        return "<noreturn>{}</noreturn>\n".format(operand)
+        return f"<noreturn>{operand}</noreturn>\n"
 
     # Creates a <formatstr/> tag for a function argument
     def compose_formatstr_string(self, token: str) -> str:
-        if regex.fullmatch("fmt", token, regex.IGNORECASE):
+        if token.lower() == "fmt":
             return "<formatstr/>"
 
-        specifier_match = retrieve_match_between_braces(token)
-        if specifier_match is None:
+        specifier_text = retrieve_match_between_braces(token)
+        if specifier_text is None:
             raise ParseError("Malformed format specifier: '{}'. Possibly missing a brace."
                              .format(token))
 
-        specifier = specifier_match[0].lower()
+        specifier = specifier_text.lower()
         if len(specifier) == 0 or specifier not in ["printf", "scanf"]:
             raise ParseError(("Malformed format specifier. "
                               "Specifier in a format string must be either 'printf' or 'scanf', "
                               "but saw '{}' instead.".format(specifier)))
-        return "<formatstr type=\"{}\"/>".format(specifier)
+        return f"<formatstr type=\"{specifier}\"/>"
 
     # Creates a <minsize/> tag for a function argument
     def compose_minsize_string(self, token: str) -> str:
-        specifier_match = retrieve_match_between_braces(token)
-        if specifier_match is None:
+        specifier_text = retrieve_match_between_braces(token)
+        if specifier_text is None:
             raise ParseError("Malformed minsize specifier '{}'.".format(token))
 
-        args = [item.strip().lower() for item in specifier_match[0].split(",")]
+        args = [item.strip().lower() for item in specifier_text.split(",")]
         args_len = len(args)
 
         if args_len < 2:
@@ -548,81 +587,96 @@ class Parser:
             raise ParseError("Excess elements in minsize specifier. Expected '{}', but saw '{}'."
                              .format(expected_str, token))
 
-        if not all(arg.isdigit() for arg in args[1:]):
+        # Joining the arguments lets isdigit() check them all in one go,
+        # though an empty argument would then go unnoticed, so reject those first.
+        if "" in args or not "".join(args[1:]).isdigit():
             raise ParseError("Arguments in a minsize specifier must be decimal integral values.")
 
         if is_mul_type:
-            return "<minsize type=\"{}\" arg=\"{}\" arg2=\"{}\"/>".format(args[0], args[1], args[2])
+            return f"<minsize type=\"{args[0]}\" arg=\"{args[1]}\" arg2=\"{args[2]}\"/>"
 
-        return "<minsize type=\"{}\" arg=\"{}\"/>".format(args[0], args[1])
+        return f"<minsize type=\"{args[0]}\" arg=\"{args[1]}\"/>"
 
     # Creates a valid range string for a function argument (<valid></valid>)
     def compose_valid_range_string(self, token: str) -> str:
-        specifier_match = retrieve_match_between_braces(token)
-        if specifier_match is None:
+        specifier_text = retrieve_match_between_braces(token)
+        if specifier_text is None:
             raise ParseError("Malformed valid range specifier: '{}'".format(token))
 
         # TODO: Could probably try sanitizing this syntax more.
-        specifier = specifier_match[0].lower()
-        if len(specifier) == 0:
+        if len(specifier_text) == 0:
             raise ParseError("A valid range specifier may not be empty.")
 
-        return "<valid>{}</valid>".format(specifier_match[0])
+        return f"<valid>{specifier_text}</valid>"
+
+    # Starting sequences of argument attributes. Attributes that take no
+    # parameters map directly to their tag, while the rest map to the
+    # method that composes their tag from the token.
+    _ARGUMENT_ATTRIBUTES = PrefixTable({
+        "fmt": compose_formatstr_string,
+        "min": compose_minsize_string,
+        "nb":  "<not-bool/>",
+        "nn":  "<not-null/>",
+        "nu":  "<not-uninit/>",
+        "s":   "<strz/>",
+        "v":   compose_valid_range_string,
+    })
+
+    # Argument lines draw from a small set of attribute tokens
+    # (nn, nu, s, etc.), so cache what each token resolves to.
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def lookup_argument_attribute(token: str) -> typing.Union[str, typing.Callable, None]:
+        return Parser._ARGUMENT_ATTRIBUTES.lookup(token)
 
     # Creates an argument string for a function definition
     def compose_argument_string(self, line: str) -> str:
-        tokens = line.split(" ")
-        argument = "<arg nr=\"{}\">".format(tokens[0])
+        tokens = line.split()
+        parts = [f"<arg nr=\"{tokens[0]}\">"]
         for token in tokens[1:]:
-            attribute_type = determine_argument_attribute_type(token)
-            if attribute_type == ArgumentAttributeType.FORMAT_STR:
-                argument += self.compose_formatstr_string(token)
-            elif attribute_type == ArgumentAttributeType.MIN_SIZE:
-                argument += self.compose_minsize_string(token)
-            elif attribute_type == ArgumentAttributeType.NOT_BOOL:
-                argument += "<not-bool/>"
-            elif attribute_type == ArgumentAttributeType.NOT_NULL:
-                argument += "<not-null/>"
-            elif attribute_type == ArgumentAttributeType.NOT_UNINIT:
-                argument += "<not-uninit/>"
-            elif attribute_type == ArgumentAttributeType.NULL_TERM_STRING:
-                argument += "<strz/>"
-            elif attribute_type == ArgumentAttributeType.VALID_RANGE:
-                argument += self.compose_valid_range_string(token)
-
-        argument += "</arg>\n"
-        return argument
+            attribute = self.lookup_argument_attribute(token)
+            if attribute is None:
+                raise ParseError("Invalid argument attribute '{}' encountered.".format(token))
+
+            if isinstance(attribute, str):
+                parts.append(attribute)
+            else:
+                parts.append(attribute(self, token))
+
+        parts.append("</arg>\n")
+        return "".join(parts)
 
     # Parses a memory or resource allocation tag
     def parse_alloc(self, alloc_type: LineType) -> None:
-        composed_alloc = Indentation.FUNCTION
-        end_alloc = Indentation.FUNCTION
+        parts = [_IND_F]
+        end_alloc = _IND_F
         if alloc_type == LineType.MEM_ALLOC:
-            composed_alloc += "<memory>\n"
+            parts.append("<memory>\n")
             end_alloc += "</memory>\n"
         elif alloc_type == LineType.RES_ALLOC:
-            composed_alloc += "<resource>\n"
+            parts.append("<resource>\n")
             end_alloc += "</resource>\n"
 
         # Keep going until an empty line
         has_alloc = False
         has_dealloc = False
+        lines = self.lines
+        total_lines = len(lines)
         while True:
             self.line_no += 1
 
             # Hit the end of the file
-            if self.line_no >= len(self.lines):
+            if self.line_no >= total_lines:
                 if not has_alloc or not has_dealloc:
                     raise ParseError("Allocation block hit end-of-file before being fully defined.")
                 break
 
-            next_line = self.lines[self.line_no].strip()
-            line_type = determine_allocation_line_type(next_line)
+            next_line = lines[self.line_no]
+            line_type, tokens = classify_allocation_line(next_line)
 
             if line_type == AllocationLineType.EMPTY:
                 break
 
-            tokens = next_line.split()
             tokens_len = len(tokens)
 
             # Deduplicating this would be nice...
@@ -635,33 +689,37 @@ class Parser:
                                   "Expected at most 3 arguments but saw "
                                   "{}: {}".format(tokens_len, tokens)))
 
-            composed_alloc += Indentation.FUNCTION_ENTRY
+            parts.append(_IND_FE)
 
             if line_type == AllocationLineType.ALLOC_FUNC:
                 has_alloc = True
-                composed_alloc += "<alloc"
-                if tokens[1] == "init":
-                    if len(tokens) < 3:
+                first_arg = tokens[1]
+                if first_arg == "init":
+                    if tokens_len < 3:
                         raise ParseError(("Missing function name in allocation block: '{}'.\n"
                                           "Note: 'init' is used to specify that the allocation "
                                           "function also initializes the allocated data.".format(next_line)))
 
-                    composed_alloc += " init=\"true\">" + tokens[2]
+                    parts.append(_ALLOC_INIT_TRUE)
+                    parts.append(tokens[2])
                 else:
-                    composed_alloc += " init=\"false\">" + tokens[1]
+                    parts.append(_ALLOC_INIT_FALSE)
+                    parts.append(first_arg)
 
-                composed_alloc += "</alloc>\n"
+                parts.append("</alloc>\n")
             elif line_type == AllocationLineType.DEALLOC_FUNC:
                 has_dealloc = True
-                composed_alloc += "<dealloc>" + tokens[1] + "</dealloc>\n"
+                parts.append("<dealloc>")
+                parts.append(tokens[1])
+                parts.append("</dealloc>\n")
 
         if not has_alloc:
             raise ParseError("An allocation block cannot be defined without an allocation function.")
         if not has_dealloc:
             raise ParseError("An allocation block cannot be defined within a deallocation function.")
 
-        composed_alloc += end_alloc
-        self.out_file.write(composed_alloc)
+        parts.append(end_alloc)
+        self.out_file.write("".join(parts))
 
     # Parses a podtype definition tag
     def parse_podtype(self, line: str) -> None:
@@ -681,13 +739,13 @@ class Parser:
         def handle_argument(token: str) -> str:
             if token not in ["s", "u"]:
                 if token.isdigit():
-                    return " size=\"{}\"".format(token)
+                    return f" size=\"{token}\""
 
                 raise ParseError("Invalid podtype argument value '{}'".format(token))
             else:
-                return " sign=\"{}\"".format(lower_sign)
+                return f" sign=\"{lower_sign}\""
 
-        podtype_str = "{}<podtype name=\"{}\"".format(Indentation.FUNCTION, tokens[1])
+        podtype_str = f"{_IND_F}<podtype name=\"{tokens[1]}\""
         if tokens_len >= 3:
             lower_sign = tokens[2].lower()
             podtype_str += handle_argument(lower_sign)
@@ -708,64 +766,63 @@ class Parser:
                               "name and value."))
 
         # Escape the value string, as C uses some characters that are special
-        # in XML that need escaping (notably, < > ' " &). By default escape()
-        # only escapes < > and & by default, so we need to add the apostrophe
-        # and quotation mark.
+        # in XML that need escaping (notably, < > ' " &). Most values are plain
+        # numbers or identifiers, so skip escaping when there's nothing to escape.
         define_name = tokens[1]
-        define_value = xml.sax.saxutils.escape(tokens[2], entities={
-                "'": "&apos;",
-                "\"": "&quot;"
-            }).strip()
+        define_value = tokens[2]
+        if not _XML_SPECIAL_CHARS.isdisjoint(define_value):
+            define_value = define_value.translate(_XML_ESCAPE_TABLE)
 
-        define_str = "{}<define name=\"{}\" value=\"{}\"/>\n" \
-                     .format(Indentation.FUNCTION, define_name, define_value)
+        define_str = f"{_IND_F}<define name=\"{define_name}\" value=\"{define_value}\"/>\n"
         self.out_file.write(define_str)
 
     # Parses a function with the given line as the beginning
     # of the function.
     def parse_function(self, line: str) -> None:
-        function_header = line.split(" ")
+        function_header = line.split()
         if len(function_header) != 2:
             raise ParseError(("Malformed function header. "
                               "Expected function specifier and a following name,"
                               "but saw '{}' instead.".format(line)))
 
         name = function_header[1]
-        composed_function = "{}<function name=\"{}\">\n".format(Indentation.FUNCTION, name)
+        parts = [f"{_IND_F}<function name=\"{name}\">\n"]
 
         # Keep going until an empty line.
+        lines = self.lines
+        total_lines = len(lines)
         while True:
             self.line_no += 1
 
             # Hit the end of the file without a newline
-            if self.line_no >= len(self.lines):
+            if self.line_no >= total_lines:
                 break
 
-            next_line = self.lines[self.line_no]
-            next_line = next_line.strip()
+            next_line = lines[self.line_no]
             line_type = determine_function_line_type(next_line)
 
-            entry_str = ""
             if line_type == FunctionLineType.EMPTY:
                 break
             elif line_type == FunctionLineType.PURE:
-                entry_str = "<pure/>\n"
+                parts.append(_FE_PURE)
             elif line_type == FunctionLineType.CONST:
-                entry_str = "<const/>\n"
+                parts.append(_FE_CONST)
             elif line_type == FunctionLineType.LEAK_IGNORE:
-                entry_str = "<leak-ignore/>\n"
+                parts.append(_FE_LEAK_IGNORE)
             elif line_type == FunctionLineType.USE_RETVAL:
-                entry_str = "<use-retval/>\n"
+                parts.append(_FE_USE_RETVAL)
             elif line_type == FunctionLineType.RETURN_TYPE:
-                entry_str = self.compose_return_value_string(next_line)
+                parts.append(_IND_FE)
+                parts.append(self.compose_return_value_string(next_line))
             elif line_type == FunctionLineType.NORETURN:
-                entry_str = self.compose_noreturn_string(next_line)
+                parts.append(_IND_FE)
+                parts.append(self.compose_noreturn_string(next_line))
             elif line_type == FunctionLineType.ARGUMENT:
-                entry_str = self.compose_argument_string(next_line)
+                parts.append(_IND_FE)
+                parts.append(self.compose_argument_string(next_line))
 
-            composed_function += Indentation.FUNCTION_ENTRY + entry_str
-        composed_function += Indentation.FUNCTION + "</function>\n"
-        self.out_file.write(composed_function)
+        parts.append(_FUNCTION_END)
+        self.out_file.write("".join(parts))
 
     # Determines what 'thing' the line identifies as and hands
     # it off to a dedicated parsing function
@@ -779,7 +836,7 @@ class Parser:
         elif line_type == LineType.FUNCTION:
             self.parse_function(line)
         elif line_type == LineType.COMMENT_INCLUDE:
-            self.out_file.write(Indentation.FUNCTION + "<!-- " + line[1:].strip() + " -->\n")
+            self.out_file.write(_IND_F + "<!-- " + line[1:].strip() + " -->\n")
         elif line_type == LineType.COMMENT_EXCLUDE:
             pass
         elif line_type in [LineType.MEM_ALLOC, LineType.RES_ALLOC]:
@@ -794,43 +851,76 @@ class Parser:
     def parse_lines(self) -> None:
         self.write_file_begin()
 
-        total_lines = len(self.lines)
+        lines = self.lines
+        parse_line = self.parse_line
+        total_lines = len(lines)
         while self.line_no < total_lines:
-            self.parse_line(lines[self.line_no])
+            parse_line(lines[self.line_no])
             self.line_no += 1
 
         self.write_file_end()
 
 
+# The parser emits many small fragments, so give the output
+# file a generous buffer so they aren't flushed individually.
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+def process_file(input_file_path: str, output_file_path: str) -> int:
+    """
+    Converts a single SKIT file into a cppcheck cfg file and reports
+    the outcome. Returns 0 on success, or the exit code to use on failure.
+    """
+    parser = None
+    try:
+        with open(input_file_path, encoding="utf-8", mode="r") as in_file, \
+             open(output_file_path, encoding="utf-8", mode="w",
+                  buffering=OUTPUT_BUFFER_SIZE) as out_file:
+            # Lines are stripped up front so the parser never needs to.
+            lines = [line.strip() for line in in_file.read().splitlines()]
+            parser = Parser(lines, out_file)
+            parser.parse_lines()
+    except FileNotFoundError:
+        print("Unable to find file: {}".format(input_file_path))
+        return -1
+    except OSError as oe:
+        print("Unable to open file: {}\nReason:{}".format(input_file_path, oe))
+        return -2
+    except ParseError as pe:
+        print("Error at line {} of {}!\n{}".format(parser.line_no + 1, input_file_path, pe))
+        return -3
+
+    print("Success!\nGenerated XML stored to output file {}".format(os.path.abspath(output_file_path)))
+    return 0
+
+
 #
 # Actual use of the code below
 #
+# Any number of input/output file pairs may be given, e.g.
+#
+#   Generator.py a.sk a.cfg b.sk b.cfg
+#
+# Each file is independent of the others, so when there's more
+# than one they're converted in parallel across processes.
+#
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("An input file must be provided.")
+        sys.exit(-1)
+
+    if len(sys.argv) % 2 != 1:
+        print("An output filename must be provided.")
+        sys.exit(-1)
+
+    file_pairs = list(zip(sys.argv[1::2], sys.argv[2::2]))
+
+    if len(file_pairs) == 1:
+        results = [process_file(*file_pairs[0])]
+    else:
+        with multiprocessing.Pool(min(len(file_pairs), os.cpu_count() or 1)) as pool:
+            results = pool.starmap(process_file, file_pairs)
 
-if len(sys.argv) < 2:
-    print("An input file must be provided.")
-    sys.exit(-1)
-
-if len(sys.argv) < 3:
-    print("An output filename must be provided.")
-    sys.exit(-1)
-
-input_file_path = sys.argv[1]
-output_file_path = sys.argv[2]
-
-try:
-    with open(input_file_path, encoding="utf-8", mode="r") as in_file, \
-         open(output_file_path, encoding="utf-8", mode="w") as out_file:
-        lines = in_file.read().split('\n')
-        parser = Parser(lines, out_file)
-        parser.parse_lines()
-except FileNotFoundError:
-    print("Unable to find file: {}\nExiting...".format(input_file_path))
-    sys.exit(-1)
-except OSError as oe:
-    print("Unable to open file: {}\nReason:{}\nExiting...".format(input_file_path, oe))
-    sys.exit(-2)
-except ParseError as pe:
-    print("Error at line {}!\n{}".format(parser.line_no + 1, pe))
-    sys.exit(-3)
-
-print("Success!\nGenerated XML stored to output file {}".format(os.path.abspath(output_file_path)))
+    # Report the first failure, if any, through the exit code.
+    sys.exit(next((result for result in results if result != 0), 0))